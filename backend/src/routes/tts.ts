@@ -18,6 +18,27 @@ const TTS_CACHE_DIR = join(getWorkspacePath(), 'cache', 'tts')
 const CACHE_TTL_MS = 24 * 60 * 60 * 1000
 const MAX_CACHE_SIZE_MB = 200
 const MAX_CACHE_SIZE_BYTES = MAX_CACHE_SIZE_MB * 1024 * 1024
+const CACHE_CLEANUP_TARGET_BYTES = Math.floor(MAX_CACHE_SIZE_BYTES * 0.9)
+const MEMORY_CACHE_MAX_MB = 20
+const MEMORY_CACHE_MAX_BYTES = MEMORY_CACHE_MAX_MB * 1024 * 1024
+
+const memoryCache = new Map<string, { audio: Buffer; cachedAt: number }>()
+let memoryCacheBytes = 0
+type SynthesisOutcome =
+  | { audio: Buffer }
+  | { error: Record<string, unknown>; status: 400 | 500 }
+
+type InflightSynthesis = {
+  cacheKey: string
+  outcome: Promise<SynthesisOutcome | null>
+  settle: (outcome: SynthesisOutcome | null) => void
+  waiters: number
+  waiterLeft: () => void
+}
+
+const inflightSyntheses = new Map<string, InflightSynthesis>()
+let trackedCacheSizeBytes: number | null = null
+let cacheSizeScan: Promise<number> | null = null
 
 const TTSRequestSchema = z.object({
   text: z.string().min(1).max(4096),
@@ -33,17 +54,57 @@ async function ensureCacheDir(): Promise<void> {
   await mkdirSafe(TTS_CACHE_DIR)
 }
 
+function forgetAudio(cacheKey: string): void {
+  const remembered = memoryCache.get(cacheKey)
+  if (!remembered) return
+  
+  memoryCache.delete(cacheKey)
+  memoryCacheBytes -= remembered.audio.length
+}
+
+function rememberAudio(cacheKey: string, audio: Buffer, cachedAt: number): void {
+  forgetAudio(cacheKey)
+  if (audio.length > MEMORY_CACHE_MAX_BYTES) return
+  
+  memoryCache.set(cacheKey, { audio, cachedAt })
+  memoryCacheBytes += audio.length
+  
+  for (const oldestKey of memoryCache.keys()) {
+    if (memoryCacheBytes <= MEMORY_CACHE_MAX_BYTES) break
+    forgetAudio(oldestKey)
+  }
+}
+
+function clearAudioMemoryCache(): void {
+  memoryCache.clear()
+  memoryCacheBytes = 0
+}
+
+function cacheKeyFromFile(file: string): string {
+  return file.slice(0, -'.mp3'.length)
+}
+
 async function getCachedAudio(cacheKey: string): Promise<Buffer | null> {
+  const remembered = memoryCache.get(cacheKey)
+  if (remembered && Date.now() - remembered.cachedAt <= CACHE_TTL_MS) {
+    rememberAudio(cacheKey, remembered.audio, remembered.cachedAt)
+    return remembered.audio
+  }
+  forgetAudio(cacheKey)
+  
   try {
     const filePath = join(TTS_CACHE_DIR, `${cacheKey}.mp3`)
     const fileStat = await stat(filePath)
     
     if (Date.now() - fileStat.mtimeMs > CACHE_TTL_MS) {
       await unlink(filePath)
+      adjustCacheSize(-fileStat.size)
       return null
     }
     
-    return await readFile(filePath)
+    const audio = await readFile(filePath)
+    rememberAudio(cacheKey, audio, fileStat.mtimeMs)
+    return audio
   } catch {
     return null
   }
@@ -68,24 +129,54 @@ async function getCacheSize(): Promise<number> {
   }
 }
 
-async function cleanupOldestFiles(requiredSpace: number): Promise<void> {
+function invalidateCacheSize(): void {
+  trackedCacheSizeBytes = null
+  cacheSizeScan = null
+}
+
+function adjustCacheSize(deltaBytes: number): void {
+  if (trackedCacheSizeBytes !== null) {
+    trackedCacheSizeBytes += deltaBytes
+  }
+}
+
+async function scanCacheSize(): Promise<number> {
+  const scannedSize = await getCacheSize()
+  trackedCacheSizeBytes = scannedSize
+  cacheSizeScan = null
+  return trackedCacheSizeBytes
+}
+
+async function getTrackedCacheSize(): Promise<number> {
+  if (trackedCacheSizeBytes !== null) return trackedCacheSizeBytes
+  
+  cacheSizeScan ??= scanCacheSize()
+  return cacheSizeScan
+}
+
+async function cleanupOldestFiles(requiredSpace: number): Promise<number> {
+  let freedSpace = 0
   try {
     const files = await readdir(TTS_CACHE_DIR)
     const fileInfos = []
+    let scannedSize = 0
     
     for (const file of files) {
       if (!file.endsWith('.mp3')) continue
       
       const filePath = join(TTS_CACHE_DIR, file)
       const fileStat = await stat(filePath)
-      fileInfos.push({ path: filePath, mtimeMs: fileStat.mtimeMs, size: fileStat.size })
+      fileInfos.push({ cacheKey: cacheKeyFromFile(file), path: filePath, mtimeMs: fileStat.mtimeMs, size: fileStat.size })
+      scannedSize += fileStat.size
     }
     
+    trackedCacheSizeBytes = scannedSize
     fileInfos.sort((a, b) => a.mtimeMs - b.mtimeMs)
     
-    let freedSpace = 0
     for (const fileInfo of fileInfos) {
       await unlink(fileInfo.path)
+      forgetAudio(fileInfo.cacheKey)
+      adjustCacheSize(-fileInfo.size)
       freedSpace += fileInfo.size
       
       if (freedSpace >= requiredSpace) break
@@ -95,19 +186,109 @@ async function cleanupOldestFiles(requiredSpace: number): Promise<void> {
   } catch (error) {
     logger.error('TTS cache cleanup failed:', error)
   }
+  
+  return freedSpace
 }
 
 async function cacheAudio(cacheKey: string, audioData: Buffer): Promise<void> {
   const filePath = join(TTS_CACHE_DIR, `${cacheKey}.mp3`)
   
   await ensureCacheDir()
-  const currentCacheSize = await getCacheSize()
+  const currentCacheSize = await getTrackedCacheSize()
   
   if (currentCacheSize + audioData.length > MAX_CACHE_SIZE_BYTES) {
-    await cleanupOldestFiles(audioData.length)
+    await cleanupOldestFiles(currentCacheSize + audioData.length - CACHE_CLEANUP_TARGET_BYTES)
   }
   
   await writeFile(filePath, audioData)
+  adjustCacheSize(audioData.length)
+  rememberAudio(cacheKey, audioData, Date.now())
+}
+
+async function cacheAudioStream(
+  cacheKey: string,
+  stream: ReadableStream<Uint8Array>,
+  onDrained?: (audio: Buffer | null) => void,
+): Promise<Buffer | null> {
+  let audioBuffer: Buffer
+  try {
+    audioBuffer = Buffer.from(await new Response(stream).arrayBuffer())
+  } catch (error) {
+    logger.error('TTS audio stream failed:', error)
+    onDrained?.(null)
+    return null
+  }
+  onDrained?.(audioBuffer)
+  
+  try {
+    await cacheAudio(cacheKey, audioBuffer)
+    logger.info(`TTS audio cached: ${cacheKey.substring(0, 8)}...`)
+  } catch (error) {
+    logger.error('TTS audio caching failed:', error)
+  }
+  
+  return audioBuffer
+}
+
+function getStreamedAudioHeaders(upstream: Response): Record<string, string> {
+  const headers: Record<string, string> = {
+    'Content-Type': 'audio/mpeg',
+    'X-Cache': 'MISS',
+  }
+  
+  const contentLength = upstream.headers.get('content-length')
+  if (contentLength && !upstream.headers.has('content-encoding')) {
+    headers['Content-Length'] = contentLength
+  }
+  
+  return headers
+}
+
+function trackInflightSynthesis(cacheKey: string, waiterLeft: () => void): InflightSynthesis {
+  let settle!: InflightSynthesis['settle']
+  const outcome = new Promise<SynthesisOutcome | null>((resolve) => {
+    settle = resolve
+  })
+  const inflight: InflightSynthesis = { cacheKey, outcome, settle, waiters: 0, waiterLeft }
+  
+  inflightSyntheses.set(cacheKey, inflight)
+  return inflight
+}
+
+function releaseInflightSynthesis(inflight: InflightSynthesis): void {
+  if (inflightSyntheses.get(inflight.cacheKey) === inflight) {
+    inflightSyntheses.delete(inflight.cacheKey)
+  }
+}
+
+function endInflightSynthesis(inflight: InflightSynthesis, outcome: SynthesisOutcome | null): void {
+  releaseInflightSynthesis(inflight)
+  inflight.settle(outcome)
+}
+
+async function shareSynthesizedAudio(inflight: InflightSynthesis, stream: ReadableStream<Uint8Array>): Promise<void> {
+  await cacheAudioStream(inflight.cacheKey, stream, (audio) => {
+    if (audio) {
+      inflight.settle({ audio })
+    } else {
+      endInflightSynthesis(inflight, null)
+    }
+  })
+  releaseInflightSynthesis(inflight)
+}
+
+function getInflightWaiterCount(cacheKey: string): number {
+  return inflightSyntheses.get(cacheKey)?.waiters ?? 0
+}
+
+function whenAborted(signal: AbortSignal): Promise<undefined> {
+  return new Promise((resolve) => {
+    if (signal.aborted) {
+      resolve(undefined)
+    } else {
+      signal.addEventListener('abort', () => resolve(undefined), { once: true })
+    }
+  })
 }
 
 
@@ -173,6 +354,8 @@ export async function cleanupExpiredCache(): Promise<number> {
         const fileStat = await stat(filePath)
         if (Date.now() - fileStat.mtimeMs > CACHE_TTL_MS) {
           await unlink(filePath)
+          forgetAudio(cacheKeyFromFile(file))
+          adjustCacheSize(-fileStat.size)
           cleanedCount++
         }
       } catch {
@@ -220,17 +403,24 @@ export async function getCacheStats(): Promise<{ count: number; sizeBytes: numbe
   }
 }
 
-export { generateCacheKey, ensureCacheDir, getCachedAudio, cacheAudio, getCacheSize, cleanupOldestFiles }
+export { MEMORY_CACHE_MAX_BYTES, generateCacheKey, ensureCacheDir, getCachedAudio, clearAudioMemoryCache, invalidateCacheSize, cacheAudio, cacheAudioStream, getStreamedAudioHeaders, getInflightWaiterCount, getCacheSize, cleanupOldestFiles }
 
 export function createTTSRoutes(db: Database) {
   const app = new Hono()
 
   app.post('/synthesize', async (c) => {
     const abortController = new AbortController()
+    let inflight: InflightSynthesis | undefined
+    let streamingToClient = false
+    
+    const abortIfUnwanted = () => {
+      if (!c.req.raw.signal.aborted || streamingToClient || (inflight && inflight.waiters > 0)) return
+      abortController.abort()
+    }
     
     c.req.raw.signal.addEventListener('abort', () => {
       logger.info('TTS request aborted by client')
-      abortController.abort()
+      abortIfUnwanted()
     })
     
     try {
@@ -266,10 +456,41 @@ export function createTTSRoutes(db: Database) {
         })
       }
       
+      for (let joined = inflightSyntheses.get(cacheKey); joined; joined = inflightSyntheses.get(cacheKey)) {
+        joined.waiters++
+        let outcome: SynthesisOutcome | null | undefined
+        try {
+          outcome = await Promise.race([joined.outcome, whenAborted(c.req.raw.signal)])
+        } finally {
+          joined.waiters--
+          joined.waiterLeft()
+        }
+        
+        if (outcome === undefined) {
+          return new Response(null, { status: 499 })
+        }
+        if (!outcome) continue
+        
+        if ('error' in outcome) {
+          logger.info(`TTS joined in-flight synthesis failed: ${cacheKey.substring(0, 8)}...`)
+          return c.json(outcome.error, outcome.status)
+        }
+        
+        logger.info(`TTS joined in-flight synthesis: ${cacheKey.substring(0, 8)}...`)
+        return new Response(outcome.audio, {
+          headers: {
+            'Content-Type': 'audio/mpeg',
+            'X-Cache': 'COALESCED',
+          },
+        })
+      }
+      
       if (abortController.signal.aborted) {
         return new Response(null, { status: 499 })
       }
       
+      const leader = trackInflightSynthesis(cacheKey, abortIfUnwanted)
+      inflight = leader
       logger.info(`TTS cache miss, calling API: ${cacheKey.substring(0, 8)}...`)
       
       const baseUrl = normalizeToBaseUrl(endpoint)
@@ -311,24 +532,29 @@ export function createTTSRoutes(db: Database) {
           // Use raw error text if parsing fails
         }
         
-        return c.json({ 
+        const errorBody = { 
           error: 'TTS API request failed', 
           details: errorDetails,
           voice: voice,
           availableVoices: ttsConfig?.availableVoices || []
-        }, status)
+        }
+        endInflightSynthesis(leader, { error: errorBody, status })
+        return c.json(errorBody, status)
       }
       
-      const audioBuffer = Buffer.from(await response.arrayBuffer())
+      if (!response.body) {
+        logger.error('TTS API returned an empty response body')
+        const errorBody = { error: 'TTS API returned empty audio' }
+        endInflightSynthesis(leader, { error: errorBody, status: 500 })
+        return c.json(errorBody, 500)
+      }
       
-      await cacheAudio(cacheKey, audioBuffer)
-      logger.info(`TTS audio cached: ${cacheKey.substring(0, 8)}...`)
+      const [clientStream, cacheStream] = response.body.tee()
+      streamingToClient = true
+      void shareSynthesizedAudio(leader, cacheStream)
       
-      return new Response(audioBuffer, {
-        headers: {
-          'Content-Type': 'audio/mpeg',
-          'X-Cache': 'MISS',
-        },
+      return new Response(clientStream, {
+        headers: getStreamedAudioHeaders(response),
       })
     } catch (error) {
       if (error instanceof Error && error.name === 'AbortError') {
@@ -339,6 +565,8 @@ export function createTTSRoutes(db: Database) {
         return c.json({ error: 'Invalid request', details: error.issues }, 400)
       }
       return c.json({ error: 'TTS synthesis failed' }, 500)
+    } finally {
+      if (inflight && !streamingToClient) endInflightSynthesis(inflight, null)
     }
   })
 
@@ -17,8 +17,15 @@ vi.mock('../../src/utils/fs-safe', () => ({
 vi.mock('bun:sqlite', () => ({
   Database: vi.fn(),
 }))
+
+const mockGetSettings = vi.fn()
+const mockUpdateSettings = vi.fn()
+
 vi.mock('../../src/services/settings', () => ({
-  SettingsService: vi.fn(),
+  SettingsService: vi.fn().mockImplementation(() => ({
+    getSettings: mockGetSettings,
+    updateSettings: mockUpdateSettings,
+  })),
 }))
 vi.mock('../../src/utils/logger', () => ({
   logger: {
@@ -32,17 +39,30 @@ const mockReadFile = fs.readFile as any
 const mockReaddir = fs.readdir as any
 const mockStat = fs.stat as any
 const mockUnlink = fs.unlink as any
+const mockWriteFile = fs.writeFile as any
 
-import { createTTSRoutes, cleanupExpiredCache, getCacheStats, generateCacheKey, ensureCacheDir, getCachedAudio, getCacheSize, cleanupOldestFiles } from '../../src/routes/tts'
+import { MEMORY_CACHE_MAX_BYTES, createTTSRoutes, cleanupExpiredCache, getCacheStats, generateCacheKey, ensureCacheDir, getCachedAudio, clearAudioMemoryCache, invalidateCacheSize, cacheAudio, cacheAudioStream, getStreamedAudioHeaders, getInflightWaiterCount, getCacheSize, cleanupOldestFiles } from '../../src/routes/tts'
+
+function streamOf(...chunks: string[]): ReadableStream<Uint8Array> {
+  return new ReadableStream({
+    start(controller) {
+      for (const chunk of chunks) controller.enqueue(new TextEncoder().encode(chunk))
+      controller.close()
+    },
+  })
+}
 
 describe('TTS Routes', () => {
   let mockDb: any
+  let ttsApp: ReturnType<typeof createTTSRoutes>
 
   beforeEach(() => {
     vi.clearAllMocks()
+    clearAudioMemoryCache()
+    invalidateCacheSize()
     
     mockDb = {} as any
-    createTTSRoutes(mockDb)
+    ttsApp = createTTSRoutes(mockDb)
   })
 
   describe('generateCacheKey', () => {
@@ -117,6 +137,37 @@ describe('getCachedAudio', () => {
       )
     })
 
+    it('should serve repeated lookups from memory without touching disk', async () => {
+      const cacheKey = 'hot-key'
+      const audioBuffer = Buffer.from('hot audio')
+
+      mockStat.mockResolvedValue({
+        mtimeMs: Date.now() - 1000,
+        size: 1024,
+      } as any)
+      mockReadFile.mockResolvedValue(audioBuffer)
+
+      await getCachedAudio(cacheKey)
+      const result = await getCachedAudio(cacheKey)
+
+      expect(result).toBe(audioBuffer)
+      expect(mockStat).toHaveBeenCalledTimes(1)
+      expect(mockReadFile).toHaveBeenCalledTimes(1)
+    })
+
+    it('should evict the oldest in-memory clips once the byte budget is exceeded', async () => {
+      const clipSize = Math.floor(MEMORY_CACHE_MAX_BYTES / 2) + 1
+      mockReaddir.mockResolvedValue([] as any)
+
+      await cacheAudio('older-key', Buffer.alloc(clipSize))
+      await cacheAudio('newer-key', Buffer.alloc(clipSize))
+
+      mockStat.mockRejectedValue(new Error('File not found'))
+
+      expect(await getCachedAudio('newer-key')).toEqual(Buffer.alloc(clipSize))
+      expect(await getCachedAudio('older-key')).toBeNull()
+    })
+
     it('should return null when cached file does not exist', async () => {
       const cacheKey = 'nonexistent-key'
       
@@ -140,6 +191,66 @@ describe('getCachedAudio', () => {
       expect(size).toBe(3072) // 1024 + 2048
     })
 
+    it('should scan the cache directory only once across consecutive writes', async () => {
+      mockReaddir.mockResolvedValue(['file1.mp3'] as any)
+      mockStat.mockResolvedValue({ size: 1024, mtimeMs: Date.now() } as any)
+
+      await cacheAudio('first-key', Buffer.from('first'))
+      await cacheAudio('second-key', Buffer.from('second'))
+
+      expect(mockReaddir).toHaveBeenCalledTimes(1)
+      expect(fs.writeFile).toHaveBeenCalledTimes(2)
+    })
+
+    it('should share one directory scan across concurrent writes', async () => {
+      mockReaddir.mockResolvedValue(['file1.mp3'] as any)
+      mockStat.mockResolvedValue({ size: 1024, mtimeMs: Date.now() } as any)
+
+      await Promise.all([
+        cacheAudio('first-key', Buffer.from('first')),
+        cacheAudio('second-key', Buffer.from('second')),
+      ])
+
+      expect(mockReaddir).toHaveBeenCalledTimes(1)
+      expect(fs.writeFile).toHaveBeenCalledTimes(2)
+    })
+
+    it('should not rescan the cache directory on the write after a full-cache cleanup', async () => {
+      mockReaddir.mockResolvedValue(['full.mp3'] as any)
+      mockStat.mockResolvedValue({ size: 200 * 1024 * 1024, mtimeMs: Date.now() } as any)
+      mockUnlink.mockResolvedValue(undefined)
+
+      await cacheAudio('overflow-key', Buffer.from('overflow'))
+
+      expect(mockReaddir).toHaveBeenCalledTimes(2)
+      expect(mockUnlink).toHaveBeenCalledWith(expect.stringContaining('full.mp3'))
+
+      await cacheAudio('next-key', Buffer.from('next'))
+
+      expect(mockReaddir).toHaveBeenCalledTimes(2)
+      expect(mockUnlink).toHaveBeenCalledTimes(1)
+    })
+
+    it('should resync the tracked size from the files seen during cleanup', async () => {
+      mockReaddir
+        .mockResolvedValueOnce(['stale.mp3', 'old.mp3'] as any)
+        .mockResolvedValue(['old.mp3'] as any)
+      mockStat
+        .mockResolvedValueOnce({ size: 199 * 1024 * 1024, mtimeMs: 1000 } as any)
+        .mockResolvedValue({ size: 60 * 1024 * 1024, mtimeMs: 2000 } as any)
+      mockUnlink.mockResolvedValue(undefined)
+
+      await cacheAudio('overflow-key', Buffer.from('overflow'))
+
+      expect(mockReaddir).toHaveBeenCalledTimes(2)
+      expect(mockUnlink).toHaveBeenCalledTimes(1)
+
+      await cacheAudio('next-key', Buffer.alloc(2 * 1024 * 1024))
+
+      expect(mockReaddir).toHaveBeenCalledTimes(2)
+      expect(mockUnlink).toHaveBeenCalledTimes(1)
+    })
+
     it('should handle cache directory errors gracefully', async () => {
       mockReaddir.mockRejectedValue(new Error('Permission denied'))
       
@@ -165,6 +276,29 @@ describe('getCachedAudio', () => {
       )
     })
 
+    it('should drop evicted files from the in-memory cache', async () => {
+      mockReaddir.mockResolvedValue(['evicted.mp3'] as any)
+      mockStat.mockResolvedValue({ size: 1024, mtimeMs: Date.now() } as any)
+      await cacheAudio('evicted', Buffer.from('evicted audio'))
+
+      await cleanupOldestFiles(1)
+      mockStat.mockRejectedValue(new Error('File not found'))
+
+      expect(await getCachedAudio('evicted')).toBeNull()
+    })
+
+    it('should drop expired files from the in-memory cache', async () => {
+      mockReaddir.mockResolvedValue(['expired.mp3'] as any)
+      mockStat.mockResolvedValue({ size: 1024, mtimeMs: Date.now() } as any)
+      await cacheAudio('expired', Buffer.from('expired audio'))
+
+      mockStat.mockResolvedValue({ size: 1024, mtimeMs: Date.now() - 25 * 60 * 60 * 1000 } as any)
+      await cleanupExpiredCache()
+      mockStat.mockRejectedValue(new Error('File not found'))
+
+      expect(await getCachedAudio('expired')).toBeNull()
+    })
+
     it('should return cache statistics for files', async () => {
       const currentTime = Date.now()
       mockReaddir.mockResolvedValue(['file1.mp3', 'file2.mp3'] as any)
@@ -195,4 +329,333 @@ describe('getCachedAudio', () => {
       )
     })
   })
-})
\ No newline at end of file
+
+  describe('cacheAudioStream', () => {
+    it('should write the fully drained stream to the cache', async () => {
+      mockReaddir.mockResolvedValue([] as any)
+
+      const audio = await cacheAudioStream('stream-key', streamOf('audio ', 'data'))
+
+      expect(audio).toEqual(Buffer.from('audio data'))
+      expect(fs.writeFile).toHaveBeenCalledWith(
+        expect.stringContaining('stream-key.mp3'),
+        Buffer.from('audio data')
+      )
+    })
+
+    it('should still return the drained audio when the cache write fails', async () => {
+      mockReaddir.mockResolvedValue([] as any)
+      mockWriteFile.mockRejectedValueOnce(Object.assign(new Error('no space left'), { code: 'ENOSPC' }))
+
+      const audio = await cacheAudioStream('full-disk-key', streamOf('audio'))
+
+      expect(audio).toEqual(Buffer.from('audio'))
+    })
+
+    it('should not write to the cache when the stream errors', async () => {
+      const failing = new ReadableStream<Uint8Array>({
+        start(controller) {
+          controller.error(new Error('upstream aborted'))
+        },
+      })
+
+      await expect(cacheAudioStream('broken-key', failing)).resolves.toBeNull()
+      expect(fs.writeFile).not.toHaveBeenCalled()
+    })
+  })
+
+  describe('getStreamedAudioHeaders', () => {
+    it('should forward the upstream Content-Length for uncompressed audio', () => {
+      const upstream = new Response(null, { headers: { 'Content-Length': '2048' } })
+
+      expect(getStreamedAudioHeaders(upstream)).toEqual({
+        'Content-Type': 'audio/mpeg',
+        'X-Cache': 'MISS',
+        'Content-Length': '2048',
+      })
+    })
+
+    it('should omit Content-Length when the upstream body is content-encoded', () => {
+      const upstream = new Response(null, {
+        headers: { 'Content-Length': '512', 'Content-Encoding': 'gzip' },
+      })
+
+      expect(getStreamedAudioHeaders(upstream)).not.toHaveProperty('Content-Length')
+    })
+  })
+
+  describe('POST /synthesize', () => {
+    let originalFetch: typeof fetch
+
+    beforeEach(() => {
+      originalFetch = globalThis.fetch
+      mockGetSettings.mockReturnValue({
+        preferences: {
+          tts: {
+            enabled: true,
+            apiKey: 'test-api-key',
+            endpoint: 'https://api.openai.com',
+            voice: 'alloy',
+            model: 'tts-1',
+            speed: 1,
+          },
+        },
+      })
+      mockStat.mockRejectedValue(new Error('File not found'))
+      mockReaddir.mockResolvedValue([] as any)
+      mockWriteFile.mockResolvedValue(undefined)
+    })
+
+    afterEach(() => {
+      globalThis.fetch = originalFetch
+    })
+
+    async function synthesize(text: string, init: RequestInit = {}): Promise<Response> {
+      return ttsApp.request('/synthesize?userId=test', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ text }),
+        ...init,
+      })
+    }
+
+    function deferUpstream(mockFetch: ReturnType<typeof vi.fn>): {
+      respond: (response: Response) => void
+      fail: (error: Error) => void
+    } {
+      let respond!: (response: Response) => void
+      let fail!: (error: Error) => void
+      mockFetch.mockImplementationOnce(() => new Promise<Response>((resolve, reject) => {
+        respond = resolve
+        fail = reject
+      }))
+      return {
+        respond: (response) => respond(response),
+        fail: (error) => fail(error),
+      }
+    }
+
+    const sharedCacheKey = generateCacheKey('Shared sentence', 'alloy', 'tts-1', 1)
+
+    async function waitForWaiters(count: number): Promise<void> {
+      await vi.waitFor(() => {
+        expect(getInflightWaiterCount(sharedCacheKey)).toBe(count)
+      })
+    }
+
+    it('should stream the upstream audio to the client and cache the same bytes', async () => {
+      const mockFetch = vi.fn().mockResolvedValue(new Response(streamOf('mp3 ', 'bytes')))
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+
+      const res = await synthesize('Hello world')
+
+      expect(res.status).toBe(200)
+      expect(res.headers.get('X-Cache')).toBe('MISS')
+      expect(Buffer.from(await res.arrayBuffer())).toEqual(Buffer.from('mp3 bytes'))
+      expect(mockFetch).toHaveBeenCalledWith(
+        'https://api.openai.com/v1/audio/speech',
+        expect.objectContaining({ method: 'POST' })
+      )
+      await vi.waitFor(() => {
+        expect(mockWriteFile).toHaveBeenCalledWith(
+          expect.stringContaining('.mp3'),
+          Buffer.from('mp3 bytes')
+        )
+      })
+    })
+
+    it('should call the upstream API once for concurrent identical requests', async () => {
+      const mockFetch = vi.fn()
+      const { respond } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+
+      const first = synthesize('Shared sentence')
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence')
+      await waitForWaiters(1)
+
+      respond(new Response(streamOf('shared audio')))
+      const [firstRes, secondRes] = await Promise.all([first, second])
+
+      expect(mockFetch).toHaveBeenCalledTimes(1)
+      expect(firstRes.headers.get('X-Cache')).toBe('MISS')
+      expect(secondRes.headers.get('X-Cache')).toBe('COALESCED')
+      expect(Buffer.from(await firstRes.arrayBuffer())).toEqual(Buffer.from('shared audio'))
+      expect(Buffer.from(await secondRes.arrayBuffer())).toEqual(Buffer.from('shared audio'))
+    })
+
+    it('should hand drained audio to waiters without waiting for the cache write', async () => {
+      const mockFetch = vi.fn()
+      const { respond } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+      let finishScan!: (files: string[]) => void
+      mockReaddir.mockImplementationOnce(() => new Promise<string[]>((resolve) => {
+        finishScan = resolve
+      }))
+
+      const first = synthesize('Shared sentence')
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence')
+      await waitForWaiters(1)
+
+      respond(new Response(streamOf('shared audio')))
+      const secondRes = await second
+
+      expect(mockWriteFile).not.toHaveBeenCalled()
+      expect(secondRes.headers.get('X-Cache')).toBe('COALESCED')
+      expect(Buffer.from(await secondRes.arrayBuffer())).toEqual(Buffer.from('shared audio'))
+
+      finishScan([])
+      await first
+      await vi.waitFor(() => {
+        expect(mockWriteFile).toHaveBeenCalledTimes(1)
+      })
+    })
+
+    it('should pass upstream error responses to waiters instead of retrying', async () => {
+      const mockFetch = vi.fn()
+      const { respond } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+
+      const first = synthesize('Shared sentence')
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence')
+      await waitForWaiters(1)
+
+      respond(new Response(JSON.stringify({ message: 'Invalid API key' }), { status: 401 }))
+      const [firstRes, secondRes] = await Promise.all([first, second])
+      const secondJson = await secondRes.json() as Record<string, unknown>
+
+      expect(mockFetch).toHaveBeenCalledTimes(1)
+      expect(firstRes.status).toBe(401)
+      expect(secondRes.status).toBe(401)
+      expect(secondJson.details).toBe('Invalid API key')
+    })
+
+    it('should retry only once for all waiters when the shared request fails without a response', async () => {
+      const mockFetch = vi.fn().mockResolvedValue(new Response(streamOf('retried audio')))
+      const { fail } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+
+      const first = synthesize('Shared sentence')
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence')
+      const third = synthesize('Shared sentence')
+      await waitForWaiters(2)
+
+      fail(new TypeError('fetch failed'))
+      const [firstRes, secondRes, thirdRes] = await Promise.all([first, second, third])
+
+      expect(mockFetch).toHaveBeenCalledTimes(2)
+      expect(firstRes.status).toBe(500)
+      expect([secondRes.headers.get('X-Cache'), thirdRes.headers.get('X-Cache')].sort()).toEqual(['COALESCED', 'MISS'])
+      expect(Buffer.from(await secondRes.arrayBuffer())).toEqual(Buffer.from('retried audio'))
+      expect(Buffer.from(await thirdRes.arrayBuffer())).toEqual(Buffer.from('retried audio'))
+    })
+
+    it('should not reuse a settled in-flight synthesis', async () => {
+      const mockFetch = vi.fn()
+        .mockResolvedValueOnce(new Response(streamOf('first audio')))
+        .mockResolvedValueOnce(new Response(streamOf('second audio')))
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+
+      const firstRes = await synthesize('Repeated sentence')
+      await firstRes.arrayBuffer()
+      await vi.waitFor(() => {
+        expect(mockWriteFile).toHaveBeenCalledTimes(1)
+      })
+      await new Promise((resolve) => setTimeout(resolve, 0))
+      clearAudioMemoryCache()
+
+      const secondRes = await synthesize('Repeated sentence')
+
+      expect(secondRes.headers.get('X-Cache')).toBe('MISS')
+      expect(Buffer.from(await secondRes.arrayBuffer())).toEqual(Buffer.from('second audio'))
+      expect(mockFetch).toHaveBeenCalledTimes(2)
+    })
+
+    it('should keep synthesizing for waiters when the first client disconnects', async () => {
+      const mockFetch = vi.fn()
+      const { respond } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+      const firstClient = new AbortController()
+
+      const first = synthesize('Shared sentence', { signal: firstClient.signal })
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence')
+      await waitForWaiters(1)
+
+      firstClient.abort()
+      const upstreamSignal = mockFetch.mock.calls[0]?.[1]?.signal as AbortSignal
+      expect(upstreamSignal.aborted).toBe(false)
+
+      respond(new Response(streamOf('shared audio')))
+      await first
+      const res = await second
+
+      expect(res.status).toBe(200)
+      expect(res.headers.get('X-Cache')).toBe('COALESCED')
+      expect(Buffer.from(await res.arrayBuffer())).toEqual(Buffer.from('shared audio'))
+      expect(mockFetch).toHaveBeenCalledTimes(1)
+    })
+
+    it('should release a waiter whose client disconnects', async () => {
+      const mockFetch = vi.fn()
+      const { respond } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+      const secondClient = new AbortController()
+
+      const first = synthesize('Shared sentence')
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence', { signal: secondClient.signal })
+      await waitForWaiters(1)
+
+      secondClient.abort()
+      const secondRes = await second
+
+      expect(secondRes.status).toBe(499)
+      expect(getInflightWaiterCount(sharedCacheKey)).toBe(0)
+
+      respond(new Response('upstream exploded', { status: 500 }))
+      expect((await first).status).toBe(500)
+    })
+
+    it('should cancel the upstream request once the first client and every waiter have disconnected', async () => {
+      const mockFetch = vi.fn()
+      const { fail } = deferUpstream(mockFetch)
+      globalThis.fetch = mockFetch as unknown as typeof fetch
+      const firstClient = new AbortController()
+      const secondClient = new AbortController()
+
+      const first = synthesize('Shared sentence', { signal: firstClient.signal })
+      await vi.waitFor(() => {
+        expect(mockFetch).toHaveBeenCalledTimes(1)
+      })
+      const second = synthesize('Shared sentence', { signal: secondClient.signal })
+      await waitForWaiters(1)
+      const upstreamSignal = mockFetch.mock.calls[0]?.[1]?.signal as AbortSignal
+
+      firstClient.abort()
+      expect(upstreamSignal.aborted).toBe(false)
+
+      secondClient.abort()
+      expect((await second).status).toBe(499)
+      expect(upstreamSignal.aborted).toBe(true)
+
+      fail(new DOMException('The operation was aborted', 'AbortError'))
+      expect((await first).status).toBe(499)
+    })
+  })
+})